@@ -1,15 +1,50 @@
 """Flask web application for Google Scholar dashboard."""
 import os
 import json
-from flask import Flask, render_template, jsonify, send_from_directory
+from functools import lru_cache
+from flask import Flask, render_template, jsonify, request, send_from_directory
 from scripts.analyze_data import ScholarAnalyzer, load_data
 
+try:
+    import orjson
+    from flask.json.provider import JSONProvider
+except ImportError:
+    # Fall back to Flask's default (stdlib json) provider
+    orjson = None
+
 app = Flask(__name__)
 app.config['JSON_SORT_KEYS'] = False
 
+if orjson is not None:
+    class OrjsonProvider(JSONProvider):
+        """Flask JSON provider backed by orjson (~10x faster serialization)."""
+
+        def dumps(self, obj, **kwargs):
+            return orjson.dumps(obj, option=orjson.OPT_NON_STR_KEYS).decode('utf-8')
+
+        def loads(self, s, **kwargs):
+            return orjson.loads(s)
+
+        def response(self, *args, **kwargs):
+            obj = args[0] if len(args) == 1 else (list(args) or kwargs)
+            # orjson returns bytes directly, avoiding an intermediate str
+            return self._app.response_class(
+                orjson.dumps(obj, option=orjson.OPT_NON_STR_KEYS),
+                mimetype='application/json')
+
+    app.json = OrjsonProvider(app)
+
 # Path to author data
 AUTHOR_DATA_PATH = os.path.join(os.path.dirname(__file__), 'author_data.json')
 
+# The data only changes on re-scrape, so let clients cache API responses
+CACHE_CONTROL = 'public, max-age=60'
+
+
+def _etag() -> str:
+    """ETag for the author data file, derived from its modification time."""
+    return hex(os.stat(AUTHOR_DATA_PATH).st_mtime_ns)
+
 
 @app.route('/')
 def index():
@@ -21,8 +56,14 @@ def index():
 def get_author_data():
     """API endpoint to get author data."""
     try:
+        etag = _etag()
+        if request.headers.get('If-None-Match') == etag:
+            return '', 304
         data = load_data(AUTHOR_DATA_PATH)
-        return jsonify(data)
+        response = jsonify(data)
+        response.headers['ETag'] = etag
+        response.headers['Cache-Control'] = CACHE_CONTROL
+        return response
     except FileNotFoundError:
         return jsonify({'error': 'Author data file not found'}), 404
     except json.JSONDecodeError:
@@ -31,49 +72,64 @@ def get_author_data():
         return jsonify({'error': str(e)}), 500
 
 
+@lru_cache(maxsize=4)
+def _compute_analysis(filepath, mtime_ns):
+    """Builds the analysis dict; cached per (path, mtime) so repeat
+    requests are served from memory until the data file changes."""
+    data = load_data(filepath)
+    analyzer = ScholarAnalyzer(data)
+    # One fused traversal of the publications list for all analyses
+    results = analyzer.analyze_all(top_areas=15)
+
+    analysis = {
+        'name': analyzer.name,
+        'affiliation': data.get('affiliation', 'Unknown'),
+        'email_domain': data.get('email_domain', ''),
+        'homepage': data.get('homepage', ''),
+        'url_picture': data.get('url_picture', ''),
+        'interests': data.get('interests', []),
+        'citation_metrics': results['citation_metrics'],
+        'research_areas': [{'term': term, 'count': count}
+                         for term, count in results['research_areas']],
+        'authorship_stats': results['authorship_stats'],
+        'publication_ranks': results['publication_ranks'],
+        'h_index': data.get('hindex', 0),
+        'h_index_5y': data.get('hindex5y', 0),
+        'i10_index': data.get('i10index', 0),
+        'i10_index_5y': data.get('i10index5y', 0),
+        'total_citations': data.get('citedby', 0),
+        'total_citations_5y': data.get('citedby5y', 0),
+        'total_publications': len(analyzer.publications),
+    }
+
+    # Add publication summaries (top 20 for display)
+    analysis['publications'] = [
+        {
+            'title': (bib := pub.get('bib', {})).get('title', 'Unknown'),
+            'year': bib.get('pub_year', 'Unknown'),
+            'venue': bib.get('venue') or bib.get('journal') or bib.get('conference', ''),
+            'citations': pub.get('num_citations', 0),
+            'url': pub.get('pub_url', ''),
+            'authors': bib.get('author', '')
+        }
+        for pub in analyzer.publications[:20]
+    ]
+
+    return analysis
+
+
 @app.route('/api/analysis')
 def get_analysis():
     """API endpoint to get analyzed author statistics."""
     try:
-        data = load_data(AUTHOR_DATA_PATH)
-        analyzer = ScholarAnalyzer(data)
-        
-        analysis = {
-            'name': analyzer.name,
-            'affiliation': data.get('affiliation', 'Unknown'),
-            'email_domain': data.get('email_domain', ''),
-            'homepage': data.get('homepage', ''),
-            'url_picture': data.get('url_picture', ''),
-            'interests': data.get('interests', []),
-            'citation_metrics': analyzer.get_citation_metrics(),
-            'research_areas': [{'term': term, 'count': count} 
-                             for term, count in analyzer.get_research_areas(15)],
-            'authorship_stats': analyzer.get_authorship_stats(),
-            'publication_ranks': analyzer.get_publication_ranks(),
-            'h_index': data.get('hindex', 0),
-            'h_index_5y': data.get('hindex5y', 0),
-            'i10_index': data.get('i10index', 0),
-            'i10_index_5y': data.get('i10index5y', 0),
-            'total_citations': data.get('citedby', 0),
-            'total_citations_5y': data.get('citedby5y', 0),
-            'total_publications': len(analyzer.publications),
-            'publications': []
-        }
-        
-        # Add publication summaries (top 20 for display)
-        for pub in analyzer.publications[:20]:
-            bib = pub.get('bib', {})
-            venue = bib.get('venue') or bib.get('journal') or bib.get('conference', '')
-            analysis['publications'].append({
-                'title': bib.get('title', 'Unknown'),
-                'year': bib.get('pub_year', 'Unknown'),
-                'venue': venue,
-                'citations': pub.get('num_citations', 0),
-                'url': pub.get('pub_url', ''),
-                'authors': bib.get('author', '')
-            })
-        
-        return jsonify(analysis)
+        etag = _etag()
+        if request.headers.get('If-None-Match') == etag:
+            return '', 304
+        analysis = _compute_analysis(AUTHOR_DATA_PATH, os.stat(AUTHOR_DATA_PATH).st_mtime_ns)
+        response = jsonify(analysis)
+        response.headers['ETag'] = etag
+        response.headers['Cache-Control'] = CACHE_CONTROL
+        return response
     except FileNotFoundError:
         return jsonify({'error': 'Author data file not found'}), 404
     except Exception as e:
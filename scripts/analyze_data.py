@@ -1,15 +1,198 @@
 """Analysis module for Google Scholar author data."""
 import json
 import argparse
+import os
 from collections import Counter
+from functools import lru_cache
 import re
 from typing import Dict, List, Tuple, Any
 
 try:
-    from .ranking_utils import get_venue_rank
+    import orjson
+except ImportError:
+    # Fall back to stdlib json when orjson isn't installed
+    orjson = None
+
+try:
+    from .ranking_utils import get_venue_metrics
 except ImportError:
     # Fallback for standalone script usage
-    from ranking_utils import get_venue_rank
+    from ranking_utils import get_venue_metrics
+
+# Precompiled patterns for the per-publication hot loops.
+# Matches words with at least 3 letters, including hyphenated words
+# (e.g., "real-time", "multi-core"); case-insensitive so titles don't
+# need a full lowercased copy before tokenization.
+_TITLE_RE = re.compile(r'\b[a-z]+(?:-[a-z]+)*[a-z]{2,}\b', re.IGNORECASE)
+# Splits author strings like "Name, Other" and "Name and Other".
+_AUTHOR_SPLIT_RE = re.compile(r',|\sand\s')
+
+# Common prefixes that should be hyphenated when found in compound words
+_HYPHEN_PREFIXES = frozenset({
+    'multi', 'real', 'time', 'cache', 'cyber', 'mixed', 'non', 'pre',
+    'post', 'semi', 'sub', 'super', 'ultra', 'inter', 'intra', 'over',
+    'under', 'cross', 'self', 'auto', 'pseudo', 'quasi', 'micro',
+    'macro', 'meta', 'hyper', 'co', 'anti', 'pro', 'counter', 'de',
+    're', 'un', 'in', 'im', 'dis', 'en', 'ex', 'out', 'up', 'down',
+    'off', 'on', 'over', 'under', 'with', 'without', 'full', 'half',
+    'all', 'any', 'some', 'every', 'no', 'new', 'old', 'high', 'low',
+    'big', 'small', 'large', 'wide', 'narrow', 'long', 'short', 'fast',
+    'slow', 'early', 'late', 'first', 'last', 'next', 'previous',
+    'single', 'double', 'triple', 'quad', 'many', 'few', 'most', 'least'
+})
+
+# Common suffixes that might appear in compound words
+_HYPHEN_SUFFIXES = frozenset({
+    'aware', 'based', 'centric', 'driven', 'enabled', 'free', 'friendly',
+    'oriented', 'proof', 'ready', 'related', 'sensitive', 'specific',
+    'style', 'type', 'wise', 'worthy', 'less', 'ful', 'like', 'wide',
+    'scale', 'level', 'grade', 'class', 'rate', 'speed', 'time', 'space',
+    'bound', 'limited', 'controlled', 'managed', 'optimized', 'tuned',
+    'adaptive', 'dynamic', 'static', 'active', 'passive', 'intelligent',
+    'smart', 'automatic', 'manual', 'semi', 'quasi', 'pseudo', 'virtual',
+    'real', 'true', 'false', 'positive', 'negative', 'neutral'
+})
+
+# Longest-first orderings so the most specific affix wins.
+_PREFIXES_SORTED = tuple(sorted(_HYPHEN_PREFIXES, key=len, reverse=True))
+_SUFFIXES_SORTED = tuple(sorted(_HYPHEN_SUFFIXES, key=len, reverse=True))
+
+# Compound-word detection as single alternation regexes, so one C-level
+# scan replaces the Python loop over ~90 prefixes / ~50 suffixes. This
+# covers the anchored dictionary-match workload an Aho-Corasick
+# automaton (pyahocorasick) would handle, without a binary dependency;
+# revisit if the affix tables grow by an order of magnitude.
+# Prefix rule: longest matching prefix whose tail is itself a known
+# suffix or at least 4 letters (mirrors the original loop exactly).
+_PREFIX_RE = re.compile(
+    '^(' + '|'.join(map(re.escape, _PREFIXES_SORTED)) + ')'
+    '(' + '|'.join(map(re.escape, _SUFFIXES_SORTED)) + '|[a-z]{4,})$')
+# Suffix rule: lazy head so the longest known suffix is preferred; the
+# head validity check (known prefix or >= 4 letters) stays in Python.
+_SUFFIX_RE = re.compile(
+    '^([a-z]{3,}?)'
+    '(' + '|'.join(map(re.escape, _SUFFIXES_SORTED)) + ')$')
+
+# Common technical terms that should be normalized (plural -> singular)
+_PLURAL_TO_SINGULAR = {
+    'systems': 'system', 'networks': 'network', 'algorithms': 'algorithm',
+    'methods': 'method', 'models': 'model', 'approaches': 'approach',
+    'techniques': 'technique', 'frameworks': 'framework', 'architectures': 'architecture',
+    'designs': 'design', 'implementations': 'implementation', 'evaluations': 'evaluation',
+    'analyses': 'analysis', 'optimizations': 'optimization', 'applications': 'application',
+    'solutions': 'solution', 'protocols': 'protocol', 'services': 'service',
+    'devices': 'device', 'nodes': 'node', 'processes': 'process', 'threads': 'thread',
+    'tasks': 'task', 'jobs': 'job', 'requests': 'request', 'queries': 'query',
+    'databases': 'database', 'tables': 'table', 'records': 'record', 'entries': 'entry',
+    'files': 'file', 'directories': 'directory', 'paths': 'path', 'links': 'link',
+    'engines': 'engine', 'servers': 'server', 'clients': 'client', 'users': 'user',
+    'interfaces': 'interface', 'components': 'component', 'modules': 'module',
+    'features': 'feature', 'functions': 'function', 'operations': 'operation',
+    'events': 'event', 'messages': 'message', 'signals': 'signal', 'packets': 'packet',
+    'channels': 'channel', 'streams': 'stream', 'flows': 'flow', 'sessions': 'session',
+    'policies': 'policy', 'strategies': 'strategy', 'mechanisms': 'mechanism',
+    'studies': 'study', 'experiments': 'experiment', 'tests': 'test', 'benchmarks': 'benchmark',
+    'metrics': 'metric', 'measurements': 'measurement', 'results': 'result', 'findings': 'finding'
+}
+
+# Set of known singular forms for pattern matching
+_KNOWN_SINGULARS = frozenset(_PLURAL_TO_SINGULAR.values())
+
+# Plural patterns as (suffix, minimum word length, transform), tried in
+# order with only the first matching suffix applied
+_PLURAL_SUFFIX_RULES = (
+    ('ies', 4, lambda w: w[:-3] + 'y'),  # "policies" -> "policy"
+    ('es', 3, lambda w: w[:-2]),         # "approaches" -> "approach"
+    ('s', 3, lambda w: w[:-1]),          # "protocols" -> "protocol"
+)
+
+# Words too generic to count as research-area keywords
+_STOP_WORDS = frozenset({
+    'for', 'and', 'the', 'of', 'in', 'a', 'an', 'to', 'on', 'with',
+    'using', 'based', 'analysis', 'via', 'study', 'from', 'by',
+    'network', 'deep', 'learning', 'system', 'systems',
+    'toward', 'towards', 'this', 'that', 'these', 'those', 'are',
+    'is', 'was', 'were', 'be', 'been', 'being', 'have', 'has', 'had'
+})
+
+@lru_cache(maxsize=4096)
+def _normalize_keyword(word: str) -> str:
+    """Normalizes a keyword by handling compound words, plurals, and variations.
+
+    Keywords repeat heavily across titles, so results are memoized;
+    repeated tokens cost a single dict lookup.
+
+    Args:
+        word: The keyword to normalize.
+
+    Returns:
+        Normalized keyword.
+    """
+    # If already hyphenated, return as-is
+    if '-' in word:
+        return word
+
+    # Try to detect and normalize compound words
+    normalized = word
+
+    # Check for common prefix patterns (e.g., "realtime" -> "real-time")
+    m = _PREFIX_RE.match(normalized)
+    if m:
+        normalized = f"{m.group(1)}-{m.group(2)}"
+
+    # Check for common suffix patterns (e.g., "cacheaware" -> "cache-aware")
+    if '-' not in normalized:
+        m = _SUFFIX_RE.match(normalized)
+        if m:
+            remaining = m.group(1)
+            # Check if remaining part could be a prefix
+            if remaining in _HYPHEN_PREFIXES or len(remaining) >= 4:
+                normalized = f"{remaining}-{m.group(2)}"
+
+    # Normalize plurals to singular for consistency (conservative approach)
+    # Check if word is a known plural form
+    if normalized in _PLURAL_TO_SINGULAR:
+        normalized = _PLURAL_TO_SINGULAR[normalized]
+    # Handle common plural patterns for technical terms; every rule
+    # suffix ends in 's', so one endswith check gates the whole table
+    elif normalized.endswith('s'):
+        for suffix, min_len, strip in _PLURAL_SUFFIX_RULES:
+            if len(normalized) > min_len and normalized.endswith(suffix):
+                # Only normalize if the base is a known technical term
+                base = strip(normalized)
+                if base in _KNOWN_SINGULARS:
+                    normalized = base
+                break
+
+    return normalized
+
+def _count_title_keywords(titles) -> Counter:
+    """Tokenizes and normalizes titles into keyword counts.
+
+    This is the hot text kernel of get_research_areas, kept as a free
+    function operating only on locals so a compiled implementation
+    could be swapped in without touching the analyzer class.
+
+    Args:
+        titles: Iterable of title strings (any case).
+
+    Returns:
+        Counter mapping normalized keyword to occurrence count.
+    """
+    counter = Counter()
+    # Local bindings avoid repeated attribute/global lookups in the loop
+    normalize = _normalize_keyword
+    tokenize = _TITLE_RE.findall
+    stop_words = _STOP_WORDS
+    for title in titles:
+        # Tokenization is case-insensitive, so the short tokens get
+        # lowercased rather than allocating a copy of the whole title;
+        # Counter.update consumes the generator on its C-level fast
+        # path without materializing an intermediate list
+        counter.update(normalize(token)
+                       for token in map(str.lower, tokenize(title))
+                       if token not in stop_words)
+    return counter
 
 class ScholarAnalyzer:
     """
@@ -19,6 +202,10 @@ class ScholarAnalyzer:
         self.data = data
         self.publications = data.get('publications', [])
         self.name = data.get('name', 'Unknown Author')
+        # Lazily filled by _run_publication_pass()
+        self._keyword_counts = None
+        self._authorship_stats = None
+        self._rank_counts = None
 
     def get_citation_metrics(self) -> Dict[str, Any]:
         """Returns summary dict of citation metrics."""
@@ -31,184 +218,104 @@ class ScholarAnalyzer:
             "trends": sorted_years
         }
 
-    def _normalize_keyword(self, word: str) -> str:
-        """Normalizes a keyword by handling compound words, plurals, and variations.
-        
+    def _run_publication_pass(self) -> None:
+        """Computes keyword, authorship and rank statistics in a single
+        traversal of the publications list.
+
+        The three per-publication analyses used to walk the same list
+        separately, each re-extracting pub['bib']; fusing them means
+        /api/analysis pays for one pass. Results are cached on the
+        instance since the underlying data never changes.
+        """
+        if self._keyword_counts is not None:
+            return
+
+        positions = {"First": 0, "Last": 0, "Middle": 0, "Single": 0}
+        rank_counts = {"A*": 0, "A": 0, "B": 0, "C": 0, "Unranked": 0, "No Venue Found": 0}
+        # Authors publish repeatedly in the same venues, so cache the
+        # (rank, IF, SJR) lookup per unique venue string for this pass
+        venue_cache: Dict[str, Tuple[str, Any, Any]] = {}
+        titles = []
+
+        target_parts = self.name.lower().split()
+        target_surname = target_parts[-1] if target_parts else ""
+
+        # Case-insensitive search avoids lowercasing every author string
+        has_surname = re.compile(re.escape(target_surname), re.IGNORECASE).search
+        split_authors = _AUTHOR_SPLIT_RE.split
+        _get_venue_metrics = get_venue_metrics
+
+        for pub in self.publications:
+            bib = pub.get('bib', {})
+
+            titles.append(bib.get('title', ''))
+
+            author_str = bib.get('author', '')
+            if author_str:
+                authors = split_authors(author_str)
+
+                # First/Last/Single cover most real data, so test those
+                # two entries directly and only scan the middle authors
+                # when neither end matches
+                if len(authors) == 1:
+                    if has_surname(authors[0]):
+                        positions["Single"] += 1
+                elif has_surname(authors[0]):
+                    positions["First"] += 1
+                elif has_surname(authors[-1]):
+                    positions["Last"] += 1
+                elif any(map(has_surname, authors[1:-1])):
+                    positions["Middle"] += 1
+
+            venue = bib.get('venue') or bib.get('journal') or bib.get('conference')
+            if not venue:
+                rank_counts["No Venue Found"] += 1
+            else:
+                metrics = venue_cache.get(venue)
+                if metrics is None:
+                    metrics = _get_venue_metrics(venue)
+                    venue_cache[venue] = metrics
+                rank = metrics[0]
+                rank_counts[rank if rank in rank_counts else "Unranked"] += 1
+
+        self._keyword_counts = _count_title_keywords(titles)
+        self._authorship_stats = positions
+        self._rank_counts = rank_counts
+
+    def analyze_all(self, top_areas: int = 10) -> Dict[str, Any]:
+        """Runs all analyses over a single traversal of the publications.
+
         Args:
-            word: The keyword to normalize.
-        
+            top_areas: Number of top research-area keywords to include.
+
         Returns:
-            Normalized keyword.
+            Dictionary with citation_metrics, research_areas,
+            authorship_stats and publication_ranks.
         """
-        # Common prefixes that should be hyphenated when found in compound words
-        hyphenated_prefixes = {
-            'multi', 'real', 'time', 'cache', 'cyber', 'mixed', 'non', 'pre', 
-            'post', 'semi', 'sub', 'super', 'ultra', 'inter', 'intra', 'over',
-            'under', 'cross', 'self', 'auto', 'pseudo', 'quasi', 'micro',
-            'macro', 'meta', 'hyper', 'co', 'anti', 'pro', 'counter', 'de',
-            're', 'un', 'in', 'im', 'dis', 'en', 'ex', 'out', 'up', 'down',
-            'off', 'on', 'over', 'under', 'with', 'without', 'full', 'half',
-            'all', 'any', 'some', 'every', 'no', 'new', 'old', 'high', 'low',
-            'big', 'small', 'large', 'wide', 'narrow', 'long', 'short', 'fast',
-            'slow', 'early', 'late', 'first', 'last', 'next', 'previous',
-            'single', 'double', 'triple', 'quad', 'many', 'few', 'most', 'least'
-        }
-        
-        # Common suffixes that might appear in compound words
-        hyphenated_suffixes = {
-            'aware', 'based', 'centric', 'driven', 'enabled', 'free', 'friendly',
-            'oriented', 'proof', 'ready', 'related', 'sensitive', 'specific',
-            'style', 'type', 'wise', 'worthy', 'less', 'ful', 'like', 'wide',
-            'scale', 'level', 'grade', 'class', 'rate', 'speed', 'time', 'space',
-            'bound', 'limited', 'controlled', 'managed', 'optimized', 'tuned',
-            'adaptive', 'dynamic', 'static', 'active', 'passive', 'intelligent',
-            'smart', 'automatic', 'manual', 'semi', 'quasi', 'pseudo', 'virtual',
-            'real', 'true', 'false', 'positive', 'negative', 'neutral'
-        }
-        
-        # If already hyphenated, return as-is
-        if '-' in word:
-            return word
-        
-        # Try to detect and normalize compound words
-        normalized = word
-        
-        # Check for common prefix patterns (e.g., "realtime" -> "real-time")
-        for prefix in sorted(hyphenated_prefixes, key=len, reverse=True):
-            if normalized.startswith(prefix) and len(normalized) > len(prefix):
-                # Check if the remaining part is a valid word
-                remaining = normalized[len(prefix):]
-                if len(remaining) >= 3:  # Minimum word length
-                    # Check if it could be a compound (e.g., "time", "core", "physical")
-                    if remaining in hyphenated_suffixes or len(remaining) >= 4:
-                        normalized = f"{prefix}-{remaining}"
-                        break
-        
-        # Check for common suffix patterns (e.g., "cacheaware" -> "cache-aware")
-        if '-' not in normalized:
-            for suffix in sorted(hyphenated_suffixes, key=len, reverse=True):
-                if normalized.endswith(suffix) and len(normalized) > len(suffix):
-                    remaining = normalized[:-len(suffix)]
-                    if len(remaining) >= 3:
-                        # Check if remaining part could be a prefix
-                        if remaining in hyphenated_prefixes or len(remaining) >= 4:
-                            normalized = f"{remaining}-{suffix}"
-                            break
-        
-        # Normalize plurals to singular for consistency (conservative approach)
-        # Common technical terms that should be normalized (plural -> singular)
-        plural_to_singular = {
-            'systems': 'system', 'networks': 'network', 'algorithms': 'algorithm',
-            'methods': 'method', 'models': 'model', 'approaches': 'approach',
-            'techniques': 'technique', 'frameworks': 'framework', 'architectures': 'architecture',
-            'designs': 'design', 'implementations': 'implementation', 'evaluations': 'evaluation',
-            'analyses': 'analysis', 'optimizations': 'optimization', 'applications': 'application',
-            'solutions': 'solution', 'protocols': 'protocol', 'services': 'service',
-            'devices': 'device', 'nodes': 'node', 'processes': 'process', 'threads': 'thread',
-            'tasks': 'task', 'jobs': 'job', 'requests': 'request', 'queries': 'query',
-            'databases': 'database', 'tables': 'table', 'records': 'record', 'entries': 'entry',
-            'files': 'file', 'directories': 'directory', 'paths': 'path', 'links': 'link',
-            'engines': 'engine', 'servers': 'server', 'clients': 'client', 'users': 'user',
-            'interfaces': 'interface', 'components': 'component', 'modules': 'module',
-            'features': 'feature', 'functions': 'function', 'operations': 'operation',
-            'events': 'event', 'messages': 'message', 'signals': 'signal', 'packets': 'packet',
-            'channels': 'channel', 'streams': 'stream', 'flows': 'flow', 'sessions': 'session',
-            'policies': 'policy', 'strategies': 'strategy', 'mechanisms': 'mechanism',
-            'studies': 'study', 'experiments': 'experiment', 'tests': 'test', 'benchmarks': 'benchmark',
-            'metrics': 'metric', 'measurements': 'measurement', 'results': 'result', 'findings': 'finding'
+        self._run_publication_pass()
+        return {
+            'citation_metrics': self.get_citation_metrics(),
+            'research_areas': self._keyword_counts.most_common(top_areas),
+            'authorship_stats': self._authorship_stats,
+            'publication_ranks': self._rank_counts,
         }
-        
-        # Set of known singular forms for pattern matching
-        known_singulars = set(plural_to_singular.values())
-        
-        # Check if word is a known plural form
-        if normalized in plural_to_singular:
-            normalized = plural_to_singular[normalized]
-        # Handle common plural patterns for technical terms
-        elif normalized.endswith('ies') and len(normalized) > 4:
-            # "policies" -> "policy", "strategies" -> "strategy"
-            base = normalized[:-3] + 'y'
-            if base in known_singulars:
-                normalized = base
-        elif normalized.endswith('es') and len(normalized) > 3:
-            # "approaches" -> "approach", "processes" -> "process"
-            base = normalized[:-2]
-            if base in known_singulars:
-                normalized = base
-        elif normalized.endswith('s') and len(normalized) > 3:
-            # Only normalize if it's a known technical term pattern
-            base = normalized[:-1]
-            if base in known_singulars:
-                normalized = base
-        
-        return normalized
 
     def get_research_areas(self, top_n: int = 10) -> List[Tuple[str, int]]:
         """Extracts common keywords from publication titles.
-        
+
         Args:
             top_n: Number of top keywords to return.
-        
+
         Returns:
             List of tuples (keyword, count) sorted by frequency.
         """
-        stop_words = {
-            'for', 'and', 'the', 'of', 'in', 'a', 'an', 'to', 'on', 'with', 
-            'using', 'based', 'analysis', 'via', 'study', 'from', 'by', 
-            'network', 'deep', 'learning', 'system', 'systems', 'with',
-            'toward', 'towards', 'this', 'that', 'these', 'those', 'are',
-            'is', 'was', 'were', 'be', 'been', 'being', 'have', 'has', 'had'
-        }
-        
-        words = []
-        for pub in self.publications:
-            title = pub.get('bib', {}).get('title', '').lower()
-            # Match words with at least 3 letters, including hyphenated words (e.g., "real-time", "multi-core")
-            tokens = re.findall(r'\b[a-z]+(?:-[a-z]+)*[a-z]{2,}\b', title)
-            
-            for token in tokens:
-                if token not in stop_words:
-                    # Normalize equivalent terms automatically
-                    normalized = self._normalize_keyword(token)
-                    words.append(normalized)
-            
-        return Counter(words).most_common(top_n)
+        self._run_publication_pass()
+        return self._keyword_counts.most_common(top_n)
 
     def get_authorship_stats(self) -> Dict[str, int]:
         """Analyzes position in author list."""
-        positions = {"First": 0, "Last": 0, "Middle": 0, "Single": 0}
-        
-        target_parts = self.name.lower().split()
-        target_surname = target_parts[-1] if target_parts else ""
-        
-        for pub in self.publications:
-            author_str = pub.get('bib', {}).get('author', '')
-            if not author_str:
-                continue
-                
-            # Handle "Name, Other" and "Name and Other"
-            authors = [a.strip() for a in re.split(r',|\sand\s', author_str)]
-            
-            # Find index
-            match_idx = -1
-            for i, a in enumerate(authors):
-                if target_surname in a.lower():
-                    match_idx = i
-                    break
-            
-            if match_idx == -1:
-                continue
-                
-            if len(authors) == 1:
-                positions["Single"] += 1
-            elif match_idx == 0:
-                positions["First"] += 1
-            elif match_idx == len(authors) - 1:
-                positions["Last"] += 1
-            else:
-                positions["Middle"] += 1
-                
-        return positions
+        self._run_publication_pass()
+        return self._authorship_stats
 
     def get_publication_ranks(self, verbose: bool = False) -> Dict[str, int]:
         """Categorizes publications by venue rank.
@@ -219,82 +326,96 @@ class ScholarAnalyzer:
         Returns:
             Dictionary mapping rank categories to counts.
         """
+        if not verbose:
+            # Lean fast path: counts come from the fused single pass
+            self._run_publication_pass()
+            return self._rank_counts
+
         rank_counts = {"A*": 0, "A": 0, "B": 0, "C": 0, "Unranked": 0, "No Venue Found": 0}
-        
-        if verbose:
-            print("\n" + "="*80)
-            print("PUBLICATION RANKING ANALYSIS")
-            print("="*80)
-        
-        for i, pub in enumerate(self.publications, 1):
+        # Authors publish repeatedly in the same venues, so cache the
+        # (rank, IF, SJR) lookup per unique venue string for this pass
+        venue_cache: Dict[str, Tuple[str, Any, Any]] = {}
+
+        pubs = self.publications
+        _get_venue_metrics = get_venue_metrics
+
+        total = len(pubs)
+        print("\n" + "="*80)
+        print("PUBLICATION RANKING ANALYSIS")
+        print("="*80)
+
+        for i, pub in enumerate(pubs, 1):
             bib = pub.get('bib', {})
             title = bib.get('title', 'Unknown Title')
             venue = bib.get('venue') or bib.get('journal') or bib.get('conference')
-            
-            if verbose:
-                print(f"\n[{i}/{len(self.publications)}] {title[:60]}...")
-                print(f"  Venue: {venue if venue else 'NOT FOUND'}")
-            
+
+            print(f"\n[{i}/{total}] {title[:60]}...")
+            print(f"  Venue: {venue if venue else 'NOT FOUND'}")
+
             if not venue:
                 rank_counts["No Venue Found"] += 1
-                if verbose:
-                    print(f"  Rank: No Venue Found")
+                print(f"  Rank: No Venue Found")
                 continue
-                
-            rank = get_venue_rank(venue)
-            
-            # Get IF and SJR for journals
-            try:
-                from .ranking_utils import get_venue_metrics
-            except ImportError:
-                from ranking_utils import get_venue_metrics
-            rank_result, impact_factor, sjr = get_venue_metrics(venue)
-            
+
+            # One lookup returns the rank plus IF and SJR for journals
+            metrics = venue_cache.get(venue)
+            if metrics is None:
+                metrics = _get_venue_metrics(venue)
+                venue_cache[venue] = metrics
+            rank, impact_factor, sjr = metrics
+
+            metrics_str = ""
+            if impact_factor is not None:
+                metrics_str += f", IF: {impact_factor:.2f}" if isinstance(impact_factor, (int, float)) else f", IF: {impact_factor}"
+            if sjr is not None:
+                metrics_str += f", SJR: {sjr:.2f}" if isinstance(sjr, (int, float)) else f", SJR: {sjr}"
+
             if rank in rank_counts:
                 rank_counts[rank] += 1
-                if verbose:
-                    metrics_str = ""
-                    if impact_factor is not None:
-                        metrics_str += f", IF: {impact_factor:.2f}" if isinstance(impact_factor, (int, float)) else f", IF: {impact_factor}"
-                    if sjr is not None:
-                        metrics_str += f", SJR: {sjr:.2f}" if isinstance(sjr, (int, float)) else f", SJR: {sjr}"
-                    print(f"  Rank: {rank}{metrics_str}")
+                print(f"  Rank: {rank}{metrics_str}")
             else:
                 rank_counts["Unranked"] += 1
-                if verbose:
-                    metrics_str = ""
-                    if impact_factor is not None:
-                        metrics_str += f", IF: {impact_factor:.2f}" if isinstance(impact_factor, (int, float)) else f", IF: {impact_factor}"
-                    if sjr is not None:
-                        metrics_str += f", SJR: {sjr:.2f}" if isinstance(sjr, (int, float)) else f", SJR: {sjr}"
-                    print(f"  Rank: Unranked (matched as '{rank}'){metrics_str}")
-        
-        if verbose:
-            print("\n" + "="*80)
-            print("RANKING SUMMARY")
-            print("="*80)
-            for rank, count in rank_counts.items():
-                if count > 0:
-                    print(f"  {rank}: {count}")
-            print("="*80 + "\n")
-                
+                print(f"  Rank: Unranked (matched as '{rank}'){metrics_str}")
+
+        print("\n" + "="*80)
+        print("RANKING SUMMARY")
+        print("="*80)
+        for rank, count in rank_counts.items():
+            if count > 0:
+                print(f"  {rank}: {count}")
+        print("="*80 + "\n")
+
         return rank_counts
 
+@lru_cache(maxsize=4)
+def _load_data_cached(filepath: str, mtime_ns: int) -> Dict[str, Any]:
+    """Reads and parses the JSON file; cached per (path, mtime)."""
+    if orjson is not None:
+        # orjson parses bytes directly, ~3x faster than stdlib json.
+        # orjson.JSONDecodeError subclasses json.JSONDecodeError, so
+        # existing error handling keeps working.
+        with open(filepath, 'rb') as f:
+            return orjson.loads(f.read())
+    with open(filepath, 'r', encoding='utf-8') as f:
+        return json.load(f)
+
 def load_data(filepath: str) -> Dict[str, Any]:
     """Loads author data from a JSON file.
-    
+
+    Results are cached in memory keyed on the file's modification time,
+    so repeated calls avoid re-reading and re-parsing unchanged data.
+
     Args:
         filepath: Path to the JSON file.
-    
+
     Returns:
         Dictionary containing author data.
-    
+
     Raises:
         FileNotFoundError: If the file doesn't exist.
         json.JSONDecodeError: If the file contains invalid JSON.
     """
-    with open(filepath, 'r', encoding='utf-8') as f:
-        return json.load(f)
+    return _load_data_cached(filepath, os.stat(filepath).st_mtime_ns)
 
 def print_report(analyzer: ScholarAnalyzer, verbose_ranking: bool = False):
     """Print analysis report.
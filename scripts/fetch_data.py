@@ -2,63 +2,203 @@
 import argparse
 import json
 import logging
+import os
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from typing import Optional, List, Dict, Any
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 from scholarly import scholarly, ProxyGenerator
 from fake_useragent import UserAgent
 
+try:
+    import orjson
+except ImportError:
+    # Fall back to stdlib json when orjson isn't installed
+    orjson = None
+
+try:
+    from .pub_cache import PublicationCache, publication_key
+except ImportError:
+    from pub_cache import PublicationCache, publication_key
+
 # Logger config
 logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
 logger = logging.getLogger(__name__)
 
-def setup_proxy() -> bool:
-    """Sets up a free proxy generator and custom session.
-    
+# Each publication fill is a blocking HTTP round-trip, so a handful of
+# threads turns the fill phase from N x RTT into roughly N/workers x RTT
+DEFAULT_WORKERS = 8
+
+def _build_session(user_agent: str) -> requests.Session:
+    """Builds a keep-alive session with pooled connections and retries.
+
+    Args:
+        user_agent: User-Agent header to send on every request.
+
     Returns:
-        bool: True if proxy was set successfully, False otherwise.
+        Configured requests.Session.
+    """
+    session = requests.Session()
+    adapter = HTTPAdapter(
+        pool_connections=8, pool_maxsize=16,
+        max_retries=Retry(total=3, backoff_factor=0.5,
+                          status_forcelist=[429, 500, 502, 503, 504]))
+    session.mount('https://', adapter)
+    session.mount('http://', adapter)
+    session.headers.update({'User-Agent': user_agent, 'Connection': 'keep-alive'})
+    return session
+
+def _install_session(user_agent: str) -> None:
+    """Attaches a persistent session to scholarly's navigator if possible.
+
+    Without this, older scholarly versions open a fresh TCP+TLS
+    connection per request, and the handshake dominates per-request
+    latency against scholar.google.com. The attribute paths differ
+    between scholarly versions, so each candidate is probed.
+    """
+    try:
+        # scholarly 1.7.x (the pinned version) name-mangles the
+        # navigator singleton onto the Scholarly instance
+        nav = (getattr(scholarly, '_Scholarly__nav', None)
+               or getattr(scholarly, '_navigator', None))
+        if nav is None:
+            logger.warning("Could not locate scholarly's navigator; "
+                           "requests will not share a connection pool.")
+            return
+        session = _build_session(user_agent)
+        if hasattr(nav, 'set_session'):
+            # Newer scholarly versions expose a public setter
+            nav.set_session(session)
+        elif hasattr(nav, '_session1'):
+            # scholarly 1.7.2: the primary (non-proxied) session
+            nav._session1 = session
+        elif hasattr(nav, '_session'):
+            nav._session = session
+        elif hasattr(nav, 'pm1') and hasattr(nav.pm1, '_session'):
+            nav.pm1._session = session
+        else:
+            logger.warning("No known session attribute on scholarly navigator; "
+                           "requests will not share a connection pool.")
+            return
+        logger.info("Persistent keep-alive session installed.")
+    except Exception as e:
+        logger.debug(f"Could not install persistent session: {e}")
+
+def setup_proxy(mode: str = 'none', proxy_url: Optional[str] = None) -> bool:
+    """Sets up the session and, if requested, a proxy for scholarly.
+
+    The free-proxy discovery loop probes many proxies synchronously and
+    can dominate CLI startup, so no proxy is used unless asked for.
+
+    Args:
+        mode: One of 'none' (default), 'free', 'scraperapi' (reads the
+            SCRAPERAPI_KEY environment variable) or 'single'.
+        proxy_url: Proxy URL for 'single' mode (falls back to the
+            SCHOLAR_PROXY_URL environment variable).
+
+    Returns:
+        bool: True if a proxy was set successfully, False otherwise.
     """
     logger.info("Setting up proxy and session...")
-    
+
+    try:
+        ua = UserAgent()
+        user_agent = ua.random
+    except Exception:
+        user_agent = 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36'
+
     # Note: Newer versions of scholarly may not support set_session
     # Try to set custom headers via the navigator if available
     try:
         # Try to set custom user agent via navigator
         if hasattr(scholarly, '_navigator') and hasattr(scholarly._navigator, 'set_user_agent'):
-            try:
-                ua = UserAgent()
-                user_agent = ua.random
-            except Exception:
-                user_agent = 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36'
             scholarly._navigator.set_user_agent(user_agent)
     except Exception as e:
         logger.debug(f"Could not set custom user agent: {e}")
 
+    # Share one keep-alive connection pool across all fills
+    _install_session(user_agent)
+
+    if mode == 'none':
+        logger.info("Proceeding without proxy.")
+        return False
+
     try:
         pg = ProxyGenerator()
-        # Try free proxies (may fail due to API changes or availability)
-        try:
-            if pg.FreeProxies():
-                logger.info("Proxy set successfully.")
-                scholarly.use_proxy(pg)
-                return True
-            else:
-                logger.warning("Failed to set proxy. Proceeding without proxy.")
+        if mode == 'scraperapi':
+            key = os.environ.get('SCRAPERAPI_KEY')
+            if not key:
+                logger.warning("SCRAPERAPI_KEY not set. Proceeding without proxy.")
+                return False
+            success = pg.ScraperAPI(key)
+        elif mode == 'single':
+            url = proxy_url or os.environ.get('SCHOLAR_PROXY_URL')
+            if not url:
+                logger.warning("No proxy URL given (--proxy-url or SCHOLAR_PROXY_URL). "
+                               "Proceeding without proxy.")
                 return False
-        except TypeError as e:
-            # Handle API changes in FreeProxies
-            logger.warning(f"FreeProxies API may have changed: {e}. Proceeding without proxy.")
-            return False
+            success = pg.SingleProxy(http=url, https=url)
+        else:
+            # Free proxies (may fail due to API changes or availability)
+            try:
+                success = pg.FreeProxies()
+            except TypeError as e:
+                # Handle API changes in FreeProxies
+                logger.warning(f"FreeProxies API may have changed: {e}. Proceeding without proxy.")
+                return False
+
+        if success:
+            logger.info("Proxy set successfully.")
+            scholarly.use_proxy(pg)
+            return True
+        logger.warning("Failed to set proxy. Proceeding without proxy.")
+        return False
     except Exception as e:
         logger.warning(f"Proxy setup failed with error: {e}. Proceeding without proxy.")
         return False
 
-def fetch_by_id(scholar_id: str, limit: Optional[int] = None) -> Optional[Dict[str, Any]]:
+def _needs_fill(pub: Dict[str, Any]) -> bool:
+    """Returns True if a publication still needs a detail fetch.
+
+    The downstream analysis only uses the title, author list, a venue
+    field and the publication year; when the profile summary row
+    already carries those, the extra per-publication HTTP request adds
+    nothing.
+
+    Args:
+        pub: Publication dict as returned by the author fill.
+    """
+    bib = pub.get('bib', {})
+    if not (bib.get('title') and bib.get('author') and bib.get('pub_year')):
+        return True
+    # Only the fields the analysis actually reads count as a venue;
+    # 'citation' is never parsed downstream, so it doesn't qualify
+    return not (bib.get('venue') or bib.get('journal') or bib.get('conference'))
+
+def fetch_by_id(scholar_id: str, limit: Optional[int] = None,
+                workers: int = DEFAULT_WORKERS,
+                force_fill: bool = False,
+                use_cache: bool = True,
+                fill_details: bool = True) -> Optional[Dict[str, Any]]:
     """Fetches author data by Scholar ID.
-    
+
+    The initial author fill already requests every section in one go,
+    including per-year citation counts, so the only remaining network
+    cost is the per-publication detail fetches; those can be skipped
+    entirely with fill_details=False at the price of sparser venue data.
+
     Args:
         scholar_id: Google Scholar ID of the author.
         limit: Maximum number of publications to fetch full details for.
-    
+        workers: Number of threads filling publication details in parallel.
+        force_fill: If True, fetch details even for publications whose
+            summary rows already contain the fields used downstream.
+        use_cache: If True, serve previously filled publications from
+            the on-disk cache and store new fills in it.
+        fill_details: If False, keep the summary rows as-is and skip
+            all per-publication detail fetches.
+
     Returns:
         Dictionary containing author data, or None if fetch failed.
     """
@@ -66,28 +206,86 @@ def fetch_by_id(scholar_id: str, limit: Optional[int] = None) -> Optional[Dict[s
     try:
         author = scholarly.search_author_id(scholar_id)
         logger.info(f"Found author: {author.get('name', 'Unknown')} (ID: {author.get('scholar_id', 'N/A')})")
-        
+
         # Fill data
         author = scholarly.fill(author, sections=['basics', 'indices', 'counts', 'publications'])
-        
+
         # Process publications
         pubs_to_process = author.get('publications', [])
         if limit and limit > 0:
             pubs_to_process = pubs_to_process[:limit]
             logger.info(f"Limiting detailed fetch to first {limit} publications.")
-            
-        full_pubs = []
+
         total_pubs = len(pubs_to_process)
-        for i, pub in enumerate(pubs_to_process, 1):
-            title = pub.get('bib', {}).get('title', 'Unknown')
-            logger.info(f"Fetching details for publication {i}/{total_pubs}: {title}")
+
+        if not fill_details:
+            # Fast mode: the summary rows already carry titles, authors,
+            # years and citation counts; only venue fields may be sparse
+            logger.info(f"Fast mode: skipping detail fetch for all {total_pubs} publications.")
+            author['publications'] = pubs_to_process
+            return author
+
+        full_pubs = [None] * total_pubs
+
+        cache = None
+        if use_cache:
             try:
-                full_pub = scholarly.fill(pub)
-                full_pubs.append(full_pub)
+                cache = PublicationCache()
             except Exception as e:
-                logger.warning(f"Failed to fill publication {i}: {e}")
-                full_pubs.append(pub)
+                logger.debug(f"Publication cache unavailable: {e}")
 
+        # Publications whose summary data already covers the analysis
+        # don't pay for an extra round-trip each, and previously filled
+        # publications are served from the on-disk cache
+        to_fill = []
+        cache_hits = 0
+        for i, pub in enumerate(pubs_to_process):
+            if not (force_fill or _needs_fill(pub)):
+                full_pubs[i] = pub
+                continue
+            if cache is not None:
+                cached = cache.get(publication_key(pub))
+                if cached is not None:
+                    full_pubs[i] = cached
+                    cache_hits += 1
+                    continue
+            to_fill.append((i, pub))
+        skipped = total_pubs - len(to_fill) - cache_hits
+        if skipped:
+            logger.info(f"Skipping detail fetch for {skipped}/{total_pubs} publications with complete bib data.")
+        if cache_hits:
+            logger.info(f"Loaded {cache_hits}/{total_pubs} publications from the on-disk cache.")
+        logger.info(f"Fetching details for {len(to_fill)} publications using {workers} workers...")
+
+        # scholarly is synchronous, so threads are the right primitive
+        # here: each fill is an independent blocking HTTP request. If a
+        # fill fails we keep the unfilled pub, matching the old loop.
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            futures = {executor.submit(scholarly.fill, pub): (i, pub)
+                       for i, pub in to_fill}
+            done = 0
+            total_fill = len(to_fill)
+            for future in as_completed(futures):
+                i, pub = futures[future]
+                done += 1
+                try:
+                    # Results land at their original index so order is kept
+                    full_pubs[i] = future.result()
+                    # Lazy %-formatting behind an explicit level check:
+                    # neither the title lookup nor the message render
+                    # runs when INFO logging is off
+                    if logger.isEnabledFor(logging.INFO):
+                        logger.info("Fetched details for publication %d/%d: %s",
+                                    done, total_fill,
+                                    pub.get('bib', {}).get('title', 'Unknown'))
+                    if cache is not None:
+                        cache.put(publication_key(pub), full_pubs[i])
+                except Exception as e:
+                    logger.warning(f"Failed to fill publication {i + 1}: {e}")
+                    full_pubs[i] = pub
+
+        if cache is not None:
+            cache.close()
         author['publications'] = full_pubs
         return author
     except Exception as e:
@@ -126,14 +324,29 @@ def main():
     group.add_argument("--id", type=str, help="Google Scholar ID of the author.")
     
     parser.add_argument("--limit", type=int, default=10, help="Limit number of publications to fetch details for (default 10).")
+    parser.add_argument("--workers", type=int, default=DEFAULT_WORKERS,
+                        help=f"Number of parallel threads for publication detail fetches (default {DEFAULT_WORKERS}).")
     parser.add_argument("--output", type=str, default="author_data.json", help="Output JSON file.")
+    parser.add_argument("--force-fill", action="store_true",
+                        help="Fetch details even for publications whose summary data is already complete.")
+    parser.add_argument("--no-cache", action="store_true",
+                        help="Bypass the on-disk publication cache and always fetch details.")
+    parser.add_argument("--fast", action="store_true",
+                        help="Skip all per-publication detail fetches (venue data may be sparse).")
+    parser.add_argument("--pretty", action="store_true",
+                        help="Indent the output JSON (roughly doubles file size and serialization cost).")
+    parser.add_argument("--proxy", choices=['none', 'free', 'scraperapi', 'single'], default='none',
+                        help="Proxy mode (default none; 'free' probes free proxies and is slow to start).")
+    parser.add_argument("--proxy-url", type=str, default=None,
+                        help="Proxy URL for --proxy single (or set SCHOLAR_PROXY_URL).")
     
     args = parser.parse_args()
     
-    setup_proxy()
+    setup_proxy(args.proxy, args.proxy_url)
     
     if args.id:
-        data = fetch_by_id(args.id, args.limit)
+        data = fetch_by_id(args.id, args.limit, workers=args.workers, force_fill=args.force_fill,
+                           use_cache=not args.no_cache, fill_details=not args.fast)
     else:
         # Search mode
         candidates = search_candidates(args.author)
@@ -143,7 +356,9 @@ def main():
             
         if len(candidates) == 1:
             logger.info("Single match found. Fetching data...")
-            data = fetch_by_id(candidates[0]['scholar_id'], args.limit)
+            data = fetch_by_id(candidates[0]['scholar_id'], args.limit, workers=args.workers,
+                               force_fill=args.force_fill, use_cache=not args.no_cache,
+                               fill_details=not args.fast)
         else:
             print(f"\nMultiple candidates found for '{args.author}':")
             for i, c in enumerate(candidates, 1):
@@ -157,8 +372,20 @@ def main():
 
     if data:
         try:
-            with open(args.output, 'w', encoding='utf-8') as f:
-                json.dump(data, f, indent=4, default=str)
+            # Compact output by default: indented JSON roughly doubles
+            # the encoder work and peak size for large profiles. The
+            # 1 MiB buffer keeps writes off the syscall path.
+            if orjson is not None:
+                # orjson serializes straight to UTF-8 bytes in one shot
+                payload = orjson.dumps(
+                    data, default=str,
+                    option=orjson.OPT_INDENT_2 if args.pretty else 0)
+                with open(args.output, 'wb', buffering=1 << 20) as f:
+                    f.write(payload)
+            else:
+                with open(args.output, 'w', encoding='utf-8', buffering=1 << 20) as f:
+                    json.dump(data, f, ensure_ascii=False, default=str,
+                              indent=4 if args.pretty else None)
             logger.info(f"Data saved to {args.output}")
         except IOError as e:
             logger.error(f"Failed to save data to {args.output}: {e}")
@@ -0,0 +1,76 @@
+"""Persistent on-disk cache for filled publication records.
+
+Re-running a fetch against the same author used to repeat every
+per-publication detail request. Filled publications are cached in a
+small SQLite database keyed by the publication's stable id, so repeat
+runs are disk-bound instead of network-bound until entries expire.
+"""
+import hashlib
+import json
+import os
+import pickle
+import sqlite3
+import time
+from typing import Any, Dict, Optional
+
+# Default cache location and entry lifetime
+DEFAULT_CACHE_PATH = os.path.join(
+    os.path.expanduser('~'), '.cache', 'scholarinsights', 'pub_cache.sqlite3')
+DEFAULT_TTL = 30 * 24 * 3600  # 30 days
+
+_SCHEMA = "CREATE TABLE IF NOT EXISTS pubs (key TEXT PRIMARY KEY, value BLOB, ts INTEGER)"
+
+def publication_key(pub: Dict[str, Any]) -> str:
+    """Returns a stable cache key for a publication.
+
+    Prefers Scholar's author_pub_id; falls back to a digest of the bib
+    data for entries that don't carry one.
+
+    Args:
+        pub: Publication dict as returned by scholarly.
+
+    Returns:
+        Cache key string.
+    """
+    pub_id = pub.get('author_pub_id')
+    if pub_id:
+        return pub_id
+    bib_json = json.dumps(pub.get('bib', {}), sort_keys=True, default=str)
+    return hashlib.blake2b(bib_json.encode('utf-8'), digest_size=16).hexdigest()
+
+class PublicationCache:
+    """SQLite-backed key/value store for filled publications."""
+
+    def __init__(self, path: str = DEFAULT_CACHE_PATH, ttl: int = DEFAULT_TTL):
+        self.ttl = ttl
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        self._conn = sqlite3.connect(path)
+        # WAL keeps writers from blocking readers on shared caches
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute(_SCHEMA)
+        self._conn.commit()
+
+    def get(self, key: str) -> Optional[Dict[str, Any]]:
+        """Returns the cached publication for key, or None if missing
+        or older than the TTL."""
+        row = self._conn.execute(
+            "SELECT value, ts FROM pubs WHERE key = ?", (key,)).fetchone()
+        if row is None:
+            return None
+        value, ts = row
+        if time.time() - ts > self.ttl:
+            return None
+        return pickle.loads(value)
+
+    def put(self, key: str, pub: Dict[str, Any]) -> None:
+        """Stores a publication under key, replacing any older entry."""
+        # pickle round-trips the scholarly dicts much faster than JSON
+        blob = pickle.dumps(pub, protocol=pickle.HIGHEST_PROTOCOL)
+        self._conn.execute(
+            "INSERT OR REPLACE INTO pubs (key, value, ts) VALUES (?, ?, ?)",
+            (key, blob, int(time.time())))
+        self._conn.commit()
+
+    def close(self) -> None:
+        """Closes the underlying database connection."""
+        self._conn.close()
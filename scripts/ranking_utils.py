@@ -10,11 +10,31 @@ Ranking Systems:
 import json
 import os
 import re
+from functools import lru_cache
 from typing import Dict, Optional, Any, Tuple
 
+try:
+    import orjson
+except ImportError:
+    # Fall back to stdlib json when orjson isn't installed
+    orjson = None
+
 # Path to the ranking database
 RANKING_DB_PATH = os.path.join(os.path.dirname(__file__), 'venue_ranks.json')
 
+# Precompiled patterns for normalize_venue_name, which runs on every
+# venue lookup and is too hot for per-call pattern-cache lookups
+_RE_AMP = re.compile(r'\s*&\s*')
+_RE_PARENS = re.compile(r'[()]')
+_RE_PUNCT = re.compile(r'[,;:]')
+_RE_DASH = re.compile(r'[-–—]')
+_RE_WS = re.compile(r'\s+')
+_RE_NONALPHA = re.compile(r'[^a-zA-Z]')
+_RE_NONALNUM = re.compile(r'[^a-zA-Z0-9]')
+
+# Words that don't contribute a letter to a venue acronym
+_ACRONYM_STOPWORDS = frozenset({'the', 'of', 'on', 'and', 'for', 'in', 'a', 'an', 'to'})
+
 def load_rankings() -> Dict[str, Any]:
     """Loads venue rankings from JSON file.
     
@@ -22,9 +42,11 @@ def load_rankings() -> Dict[str, Any]:
         Dictionary mapping venue names (lowercase) to their ranks (string) or 
         extended data (dict with rank, impact_factor, sjr).
     """
+    _loads = orjson.loads if orjson is not None else json.loads
     try:
-        with open(RANKING_DB_PATH, 'r', encoding='utf-8') as f:
-            return json.load(f)
+        # Binary read + loads lets orjson parse the raw bytes directly
+        with open(RANKING_DB_PATH, 'rb') as f:
+            return _loads(f.read())
     except FileNotFoundError:
         print(f"Warning: Ranking database not found at {RANKING_DB_PATH}")
         return {}
@@ -35,9 +57,14 @@ def load_rankings() -> Dict[str, Any]:
         print(f"Warning: Could not load ranking database from {RANKING_DB_PATH}: {e}")
         return {}
 
+@lru_cache(maxsize=4096)
 def get_venue_metrics(venue_name: Optional[str]) -> Tuple[str, Optional[float], Optional[float]]:
     """Returns rank, impact factor, and SJR for a venue.
-    
+
+    Results are memoized: authors repeat the same handful of venues
+    across their publications, so after warmup a lookup is a cache hit.
+    Use get_venue_metrics.cache_clear() after modifying the database.
+
     Args:
         venue_name: Name of the venue (journal/conference).
     
@@ -52,30 +79,24 @@ def get_venue_metrics(venue_name: Optional[str]) -> Tuple[str, Optional[float],
     name_normalized = normalize_venue_name(venue_name)
     if not name_normalized:
         return (rank, None, None)
-    
-    # Check if we have extended data for this venue
-    venue_data = VENUE_RANKS.get(name_normalized)
+
+    # Check if we have extended data for this venue (exact normalized match)
+    venue_data = _NORMALIZED_RANKS.get(name_normalized)
     if isinstance(venue_data, dict):
         return (rank, venue_data.get('impact_factor'), venue_data.get('sjr'))
-    
-    # Check normalized matches
-    for key, value in VENUE_RANKS.items():
-        key_normalized = normalize_venue_name(key)
-        if key_normalized == name_normalized:
-            if isinstance(value, dict):
-                return (rank, value.get('impact_factor'), value.get('sjr'))
-            break
-    
-    # Also check fuzzy matches for extended data
-    for key, value in VENUE_RANKS.items():
-        key_normalized = normalize_venue_name(key)
-        min_length = min(len(key_normalized), len(name_normalized))
-        if min_length >= 5:
-            if key_normalized in name_normalized or name_normalized in key_normalized:
+
+    # Also check fuzzy matches for extended data: one pass over the
+    # token-narrowed candidates, most specific key first, stopping at
+    # the first containment match just like the rank lookup
+    if len(name_normalized) >= 5:
+        for key_normalized in _token_candidates(name_normalized, _TOKEN_INDEX, _KEY_ORDER):
+            if len(key_normalized) >= 5 and (key_normalized in name_normalized
+                                             or name_normalized in key_normalized):
+                value = _NORMALIZED_RANKS[key_normalized]
                 if isinstance(value, dict):
                     return (rank, value.get('impact_factor'), value.get('sjr'))
                 break
-    
+
     return (rank, None, None)
 
 VENUE_RANKS = load_rankings()
@@ -100,24 +121,80 @@ def normalize_venue_name(venue_name: str) -> str:
     
     # Convert to lowercase
     normalized = venue_name.lower()
-    
-    # Replace "&" with "and" (and variations)
-    normalized = re.sub(r'\s*&\s*', ' and ', normalized)
-    normalized = re.sub(r'\s+and\s+', ' and ', normalized)
-    
+
+    # Replace "&" with "and"; spacing variations around a literal "and"
+    # are handled by the whitespace collapse below
+    normalized = _RE_AMP.sub(' and ', normalized)
+
     # Normalize punctuation
-    normalized = re.sub(r'[()]', '', normalized)  # Remove parentheses
-    normalized = re.sub(r'[,;:]', '', normalized)  # Remove common punctuation
-    normalized = re.sub(r'[-–—]', ' ', normalized)  # Normalize dashes to spaces
-    
+    normalized = _RE_PARENS.sub('', normalized)  # Remove parentheses
+    normalized = _RE_PUNCT.sub('', normalized)  # Remove common punctuation
+    normalized = _RE_DASH.sub(' ', normalized)  # Normalize dashes to spaces
+
     # Normalize whitespace (multiple spaces to single space)
-    normalized = re.sub(r'\s+', ' ', normalized)
-    
+    normalized = _RE_WS.sub(' ', normalized)
+
     # Strip leading/trailing whitespace
     normalized = normalized.strip()
-    
+
+    return normalized
+
+def _build_normalized_ranks() -> Dict[str, Any]:
+    """Builds a lookup of normalized venue name -> rank data.
+
+    Normalizing the database keys once at import means lookups do a
+    single dict hit (or one scan over pre-normalized keys) instead of
+    re-normalizing every key on every query. On duplicates, the first
+    key in database order wins, matching the old scan behavior.
+    """
+    normalized = {}
+    for key, value in VENUE_RANKS.items():
+        normalized.setdefault(normalize_venue_name(key), value)
     return normalized
 
+_NORMALIZED_RANKS = _build_normalized_ranks()
+
+def _build_token_index(keys) -> Dict[str, set]:
+    """Builds an inverted index of word -> set of keys containing it.
+
+    Only words of length >= 3 are indexed; shorter words are too common
+    to narrow the candidate set. Used by the fuzzy-match paths so a
+    lookup only runs containment checks against keys that share at
+    least one whole word with the query, instead of the full database.
+    """
+    index: Dict[str, set] = {}
+    for key in keys:
+        for token in set(key.split()):
+            # Strip punctuation so raw words like "(acc)" match "acc"
+            token = _RE_NONALNUM.sub('', token)
+            if len(token) >= 3:
+                index.setdefault(token, set()).add(key)
+    return index
+
+# Keys sorted longest-first (ties keep database order) so that when
+# several fuzzy candidates match, the most specific entry wins instead
+# of whichever happened to come first in the database. Computed once at
+# import; the per-query sort below only touches the candidate set.
+_SORTED_NORMALIZED = sorted(_NORMALIZED_RANKS.items(),
+                            key=lambda kv: len(kv[0]), reverse=True)
+
+# Token indexes and key positions for the normalized and raw fuzzy paths
+_TOKEN_INDEX = _build_token_index(_NORMALIZED_RANKS)
+_KEY_ORDER = {key: pos for pos, (key, _) in enumerate(_SORTED_NORMALIZED)}
+_RAW_TOKEN_INDEX = _build_token_index(VENUE_RANKS)
+_RAW_KEY_ORDER = {key: pos for pos, key in enumerate(
+    sorted(VENUE_RANKS, key=len, reverse=True))}
+_EMPTY_SET: frozenset = frozenset()
+
+def _token_candidates(name: str, index: Dict[str, set], order: Dict[str, int]) -> list:
+    """Returns indexed keys sharing a word with name, longest first."""
+    candidates: set = set()
+    for token in set(name.split()):
+        token = _RE_NONALNUM.sub('', token)
+        if len(token) >= 3:
+            candidates |= index.get(token, _EMPTY_SET)
+    return sorted(candidates, key=order.get)
+
 def extract_acronym_from_name(full_name: str) -> str:
     """Extracts potential acronym from a full venue name.
     
@@ -127,13 +204,10 @@ def extract_acronym_from_name(full_name: str) -> str:
     Returns:
         Potential acronym string (e.g., "RTSS" from "Real-Time Systems Symposium").
     """
-    words = full_name.split()
-    acronym = ""
-    for word in words:
-        # Skip very short words and common stop words
-        if len(word) > 0 and word[0].isalpha() and word.lower() not in ['the', 'of', 'on', 'and', 'for', 'in', 'a', 'an']:
-            acronym += word[0].upper()
-    return acronym
+    # Skip common stop words; join over a generator avoids the
+    # quadratic cost of repeated string concatenation
+    return ''.join(word[0].upper() for word in full_name.split()
+                   if word[0].isalpha() and word.lower() not in _ACRONYM_STOPWORDS)
 
 def match_acronym_to_full_name(acronym: str, full_name: str) -> bool:
     """Checks if an acronym matches a full venue name.
@@ -145,18 +219,44 @@ def match_acronym_to_full_name(acronym: str, full_name: str) -> bool:
     Returns:
         True if acronym matches the full name.
     """
-    acronym_upper = acronym.upper()
-    words = full_name.split()
-    
-    # Extract first letters of significant words
-    first_letters = ""
-    for word in words:
-        word_clean = re.sub(r'[^a-zA-Z]', '', word)
-        if len(word_clean) > 0 and word_clean.lower() not in ['the', 'of', 'on', 'and', 'for', 'in', 'a', 'an', 'to']:
-            first_letters += word_clean[0].upper()
-    
-    # Check if acronym matches first letters
-    return acronym_upper == first_letters
+    # Check if acronym matches the first letters of significant words
+    return acronym.upper() == _derive_acronym(full_name)
+
+def _derive_acronym(full_name: str) -> str:
+    """Derives the acronym of a full venue name from the first letters
+    of its significant (non stop-word) words.
+
+    Args:
+        full_name: Full venue name.
+
+    Returns:
+        Upper-case acronym string.
+    """
+    return ''.join(
+        word_clean[0].upper() for word in full_name.split()
+        if (word_clean := _RE_NONALPHA.sub('', word))
+        and word_clean.lower() not in _ACRONYM_STOPWORDS)
+
+def _build_acronym_index() -> Dict[str, Any]:
+    """Maps the derived acronym of every full venue name to its rank data.
+
+    Built once at import so a short query like "RTSS" is a single dict
+    hit instead of re-deriving the acronym of every database key. On
+    collisions the first key in database order wins, matching the old
+    scan behavior.
+    """
+    index = {}
+    for key, value in VENUE_RANKS.items():
+        # Only full names can be acronym targets; short keys are
+        # themselves acronyms
+        key_clean = _RE_NONALNUM.sub('', key.upper())
+        if len(key_clean) > 6 or ' ' in key:
+            acronym = _derive_acronym(key)
+            if acronym:
+                index.setdefault(acronym, value)
+    return index
+
+_ACRONYM_INDEX = _build_acronym_index()
 
 def _extract_rank(value: any) -> str:
     """Extracts rank from either string or dict format.
@@ -171,12 +271,15 @@ def _extract_rank(value: any) -> str:
         return value.get('rank', 'Unranked')
     return value
 
+@lru_cache(maxsize=4096)
 def get_venue_rank(venue_name: Optional[str]) -> str:
     """Returns the rank (A*, A, B, C) or 'Unranked' for a given venue name.
-    
+
     Uses robust matching that handles variations like "&" vs "and",
     punctuation differences, whitespace variations, and acronym matching.
-    
+    Results are memoized; use get_venue_rank.cache_clear() after
+    modifying the database.
+
     Args:
         venue_name: Name of the venue (journal/conference).
     
@@ -192,42 +295,32 @@ def get_venue_rank(venue_name: Optional[str]) -> str:
     if not name_normalized:
         return "Unknown"
     
-    # Direct match with normalized name
-    if name_normalized in VENUE_RANKS:
-        return _extract_rank(VENUE_RANKS[name_normalized])
-    
-    # Try matching against normalized database entries
-    # First, try exact match after normalizing both
-    for key, value in VENUE_RANKS.items():
-        key_normalized = normalize_venue_name(key)
-        if key_normalized == name_normalized:
-            return _extract_rank(value)
-    
-    # Check if input is a short acronym (<= 6 chars, no spaces) - try matching to full names
-    name_clean = re.sub(r'[^a-zA-Z0-9]', '', venue_name.upper())
-    if len(name_clean) <= 6 and len(name_clean) >= 2 and ' ' not in venue_name:
-        # Try to match acronym to full names in database
-        for key, value in VENUE_RANKS.items():
-            # Skip if key is also a short acronym
-            key_clean = re.sub(r'[^a-zA-Z0-9]', '', key.upper())
-            if len(key_clean) > 6 or ' ' in key:
-                # This is a full name, check if acronym matches
-                if match_acronym_to_full_name(name_clean, key):
-                    return _extract_rank(value)
-    
-    # Fuzzy match: check if normalized key is substring of normalized name or vice versa
-    for key, value in VENUE_RANKS.items():
-        key_normalized = normalize_venue_name(key)
+    # Direct match against the pre-normalized database keys
+    venue_data = _NORMALIZED_RANKS.get(name_normalized)
+    if venue_data is not None:
+        return _extract_rank(venue_data)
+    
+    # Check if input is a short acronym (<= 6 chars, no spaces) - match
+    # against the precomputed acronym index of full names
+    name_clean = _RE_NONALNUM.sub('', venue_name.upper())
+    if 2 <= len(name_clean) <= 6 and ' ' not in venue_name:
+        venue_data = _ACRONYM_INDEX.get(name_clean)
+        if venue_data is not None:
+            return _extract_rank(venue_data)
+    
+    # Fuzzy match: check if normalized key is substring of normalized name
+    # or vice versa, considering only keys sharing a word with the query
+    for key_normalized in _token_candidates(name_normalized, _TOKEN_INDEX, _KEY_ORDER):
         # Check if one contains the other (with minimum length to avoid false matches)
         min_length = min(len(key_normalized), len(name_normalized))
         if min_length >= 5:  # Only do fuzzy match if both are substantial
             if key_normalized in name_normalized or name_normalized in key_normalized:
-                return _extract_rank(value)
-    
+                return _extract_rank(_NORMALIZED_RANKS[key_normalized])
+
     # Last resort: try original (non-normalized) substring match
     name_lower = venue_name.lower().strip()
-    for key, value in VENUE_RANKS.items():
+    for key in _token_candidates(name_lower, _RAW_TOKEN_INDEX, _RAW_KEY_ORDER):
         if key in name_lower or name_lower in key:
-            return _extract_rank(value)
-            
+            return _extract_rank(VENUE_RANKS[key])
+
     return "Unranked"